@@ -6,6 +6,8 @@ Pipeline:
     2_process_ffiec.py             -> reads zip, produces figure A1 and Table A1
     3_pull_gsib_banks.py           -> writes GSIB list parquet
     4_pull_mbs_etfs.py             -> writes MBS ETF parquet
+    5_pull_fred.py                 -> writes FRED series parquet
+    6_pull_treasury_price_index.py -> writes Treasury price index parquet
     7_pull_treasury_yields.py      -> writes Treasury yield parquet
     8_compute_market_shocks.py     -> writes market shock parquet
     9_make_table_1.py              -> writes Table 1 csv/tex
@@ -22,8 +24,12 @@ Usage:
 from __future__ import annotations
 
 import os
+import runpy
+import shlex
+import sys
 from pathlib import Path
 
+from doit.tools import config_changed
 from dotenv import load_dotenv
 
 BASE_DIR = Path(__file__).resolve().parent
@@ -34,10 +40,22 @@ OUT_DIR = BASE_DIR / "_output"
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 OUT_DIR.mkdir(parents=True, exist_ok=True)
 
+# Scripts import settings (and each other) from src/, as when run directly
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from settings import config
+
 load_dotenv(BASE_DIR / ".env")
 
 REPORT_DATE = os.getenv("REPORT_DATE", "12312025")
 REPORT_DATE_SLASH = os.getenv("REPORT_DATE_SLASH", "12/31/2025")
+# Read the same way the scripts read them, so the uptodate checks below see
+# the values the pull actually ran with
+START_DATE = config("START_DATE")
+MARKET_START_DATE = config("MARKET_START_DATE")
+MARKET_END_DATE = config("MARKET_END_DATE")
+MARKET_WINDOW = {"start": MARKET_START_DATE, "end": MARKET_END_DATE}
 
 # FFIEC data
 ZIP_FILE = DATA_DIR / f"FFIEC CDR Call Bulk All Schedules {REPORT_DATE}.zip"
@@ -46,6 +64,10 @@ GSIB_PARQUET = DATA_DIR / "gsib_list.parquet"
 TREASURY_YIELDS_PARQUET = DATA_DIR / "treasury_yields.parquet"
 MBS_ETF_PARQUET = DATA_DIR / "mbs_etfs.parquet"
 MARKET_SHOCKS_PARQUET = DATA_DIR / "market_shocks.parquet"
+FRED_PARQUET = DATA_DIR / "fred.parquet"
+TREASURY_PRICE_INDEX_PARQUET = DATA_DIR / "treasury_price_index.parquet"
+# FFIEC schedule parquet cache (2_process_ffiec.py) and HTTP cache (http_cache.py)
+CACHE_DIR = DATA_DIR / "cache"
 
 # Outputs
 SUMMARY_XLSX = OUT_DIR / f"summary_stats_{REPORT_DATE}.xlsx"
@@ -61,8 +83,18 @@ REPORT_TEX = BASE_DIR / "report.tex"
 REPORT_PDF = OUT_DIR / "report.pdf"
 
 
-def _run(script_name: str) -> str:
-    return f'python "{SRC_DIR / script_name}"'
+def _run(script_name: str):
+    """
+    Run a pipeline script in the doit process instead of a fresh interpreter,
+    so pandas & co. are imported once per `doit` run.
+    """
+    script = SRC_DIR / script_name
+
+    def action():
+        runpy.run_path(str(script), run_name="__main__")
+
+    action.__name__ = f"run_{script.stem}"
+    return action
 
 
 DOIT_CONFIG = {
@@ -86,7 +118,7 @@ def task_pull_ffiec():
     """Download FFIEC Call Report zip from FFIEC."""
     return {
         "actions": [_run("1_pull_ffiec.py")],
-        "file_dep": [str(SRC_DIR / "1_pull_ffiec.py")],
+        "file_dep": [str(SRC_DIR / "1_pull_ffiec.py"), str(SRC_DIR / "http_cache.py")],
         "targets": [str(ZIP_FILE)],
         "verbosity": 2,
         "clean": True,
@@ -102,6 +134,8 @@ def task_process_ffiec():
             str(ZIP_FILE),
             str(GSIB_PARQUET),
             str(SRC_DIR / "2_process_ffiec.py"),
+            str(SRC_DIR / "ffiec_io.py"),
+            str(SRC_DIR / "parquet_io.py"),
         ],
         "targets": [
             str(BANK_PANEL),
@@ -120,7 +154,7 @@ def task_pull_gsib():
     """Create GSIB list parquet used for bank classification."""
     return {
         "actions": [_run("3_pull_gsib_banks.py")],
-        "file_dep": [str(SRC_DIR / "3_pull_gsib_banks.py")],
+        "file_dep": [str(SRC_DIR / "3_pull_gsib_banks.py"), str(SRC_DIR / "parquet_io.py")],
         "targets": [str(GSIB_PARQUET)],
         "verbosity": 2,
         "clean": True,
@@ -131,8 +165,43 @@ def task_pull_mbs_etfs():
     """Pull MBS ETF prices used for RMBS / CMBS market proxies."""
     return {
         "actions": [_run("4_pull_mbs_etfs.py")],
-        "file_dep": [str(SRC_DIR / "4_pull_mbs_etfs.py")],
+        "file_dep": [str(SRC_DIR / "4_pull_mbs_etfs.py"), str(SRC_DIR / "parquet_io.py")],
         "targets": [str(MBS_ETF_PARQUET)],
+        # The pull checks that the market window is covered
+        "uptodate": [config_changed(MARKET_WINDOW)],
+        "verbosity": 2,
+        "clean": True,
+    }
+
+
+def task_pull_fred():
+    """Pull FRED macro and Fed balance sheet series."""
+    return {
+        "actions": [_run("5_pull_fred.py")],
+        "file_dep": [
+            str(SRC_DIR / "5_pull_fred.py"),
+            str(SRC_DIR / "http_cache.py"),
+            str(SRC_DIR / "fred_csv.py"),
+            str(SRC_DIR / "parquet_io.py"),
+        ],
+        "targets": [str(FRED_PARQUET)],
+        "uptodate": [config_changed({"start": START_DATE})],
+        "verbosity": 2,
+        "clean": True,
+    }
+
+
+def task_pull_treasury_price_index():
+    """Pull the 10Y Treasury total return price index from FRED."""
+    return {
+        "actions": [_run("6_pull_treasury_price_index.py")],
+        "file_dep": [
+            str(SRC_DIR / "6_pull_treasury_price_index.py"),
+            str(SRC_DIR / "http_cache.py"),
+            str(SRC_DIR / "fred_csv.py"),
+            str(SRC_DIR / "parquet_io.py"),
+        ],
+        "targets": [str(TREASURY_PRICE_INDEX_PARQUET)],
         "verbosity": 2,
         "clean": True,
     }
@@ -142,7 +211,11 @@ def task_pull_treasury_yields():
     """Pull Treasury yield data used to construct bucket-specific shocks."""
     return {
         "actions": [_run("7_pull_treasury_yields.py")],
-        "file_dep": [str(SRC_DIR / "7_pull_treasury_yields.py")],
+        "file_dep": [
+            str(SRC_DIR / "7_pull_treasury_yields.py"),
+            str(SRC_DIR / "http_cache.py"),
+            str(SRC_DIR / "parquet_io.py"),
+        ],
         "targets": [str(TREASURY_YIELDS_PARQUET)],
         "verbosity": 2,
         "clean": True,
@@ -158,6 +231,7 @@ def task_compute_market_shocks():
             str(TREASURY_YIELDS_PARQUET),
             str(MBS_ETF_PARQUET),
             str(SRC_DIR / "8_compute_market_shocks.py"),
+            str(SRC_DIR / "parquet_io.py"),
         ],
         "targets": [str(MARKET_SHOCKS_PARQUET)],
         "verbosity": 2,
@@ -219,7 +293,7 @@ def task_compile_latex():
 
 
 def task_clean_outputs():
-    """Remove all generated data and output files."""
+    """Remove all generated data and output files, and the download/parse caches."""
     files_to_remove = [
         ZIP_FILE,
         BANK_PANEL,
@@ -231,13 +305,18 @@ def task_clean_outputs():
         TREASURY_YIELDS_PARQUET,
         MBS_ETF_PARQUET,
         MARKET_SHOCKS_PARQUET,
+        FRED_PARQUET,
+        TREASURY_PRICE_INDEX_PARQUET,
         TABLE1_CSV,
         TABLE1_TEX,
         SUMMARY_ASSETS_TEX,
         REPORT_PDF,
     ]
     return {
-        "actions": [f"rm -f {' '.join(str(p) for p in files_to_remove)}"],
+        "actions": [
+            f"rm -f {' '.join(shlex.quote(str(p)) for p in files_to_remove)}",
+            f"rm -rf {shlex.quote(str(CACHE_DIR))}",
+        ],
         "verbosity": 2,
     }
 
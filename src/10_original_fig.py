@@ -31,6 +31,9 @@ REPORT_DATE = config("REPORT_DATE")
 
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
+# Only these bank panel columns are plotted
+PANEL_COLUMNS = ["Total Asset", "Uninsured Deposit"]
+
 
 def export_figure_asset_dist(bank_panel: pd.DataFrame) -> None:
     """
@@ -109,7 +112,7 @@ def main() -> None:
     if not panel_path.exists():
         raise FileNotFoundError(f"Missing bank panel: {panel_path}")
 
-    bank_panel = pd.read_parquet(panel_path)
+    bank_panel = pd.read_parquet(panel_path, columns=PANEL_COLUMNS)
 
     print("Exporting original figures for LaTeX report...\n")
     export_figure_asset_dist(bank_panel)
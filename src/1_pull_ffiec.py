@@ -1,119 +1,249 @@
-#pull FFIEC Call Report data using Selenium
+#pull FFIEC Call Report data by replaying the bulk download WebForm
 
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import Select
+from html.parser import HTMLParser
 from pathlib import Path
+import re
 import time
+import zipfile
 
 import os
 
+from urllib3.util.retry import Retry
+
 #sys.stdout.reconfigure(encoding='utf-8'
 
 
 # Set up data directory & report date
+from http_cache import make_session
 from settings import config
 DATA_DIR = Path(config("DATA_DIR"))
 
 report_date = os.getenv("REPORT_DATE_SLASH")
 
+BULK_DATA_URL = "https://cdr.ffiec.gov/public/PWS/DownloadBulkData.aspx"
+PRODUCT = "ReportingSeriesSinglePeriod"  # "Call Reports -- Single Period"
+ZIP_NAME = "FFIEC CDR Call Bulk All Schedules {report_date}.zip"
+
+# Fixed ids of the WebForm controls; only their names and the hidden state
+# fields are read from each page
+PRODUCTS_ID = "ListBox1"
+DATES_ID = "DatesDropDownList"
+TSV_ID = "TSVRadioButton"
+DOWNLOAD_ID = "Download_0"
+
+# A downloaded bulk zip younger than this is reused instead of replaying the
+# form; filers can still amend a quarter, so it is not kept forever
+MAX_ZIP_AGE_SECONDS = 86400 * int(config("FFIEC_MAX_AGE_DAYS", default=7))
+
+# Shared keep-alive session, so pulling several report dates reuses one
+# connection to cdr.ffiec.gov. The form posts only change the page state,
+# so they are safe to retry.
+_SESSION = make_session(
+    pool_size=8,
+    retry=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[500, 502, 503, 504],
+        allowed_methods=["GET", "POST"],
+    ),
+    headers={"User-Agent": "Mozilla/5.0"},
+)
+
+
+class _WebFormParser(HTMLParser):
+    """
+    Collect what is needed to post the ASP.NET form back: hidden fields
+    (__VIEWSTATE, __EVENTVALIDATION, ...), the name/value of elements by id,
+    and the options of the reporting period dropdown.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.hidden = {}
+        self.elements = {}
+        self.date_options = []  # (value, text)
+        self._in_dates = False
+        self._option_value = None
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag in ("input", "select") and attrs.get("id"):
+            self.elements[attrs["id"]] = attrs
+        is_hidden = tag == "input" and attrs.get("type", "").lower() == "hidden"
+        if is_hidden and attrs.get("name"):
+            self.hidden[attrs["name"]] = attrs.get("value", "")
+        elif tag == "select":
+            self._in_dates = attrs.get("id") == DATES_ID
+        elif tag == "option" and self._in_dates:
+            self._option_value = attrs.get("value", "")
+
+    def handle_endtag(self, tag):
+        if tag == "select":
+            self._in_dates = False
+
+    def handle_data(self, data):
+        if self._option_value is not None:
+            self.date_options.append((self._option_value, data.strip()))
+            self._option_value = None
+
+
+def _parse_form(html):
+    parser = _WebFormParser()
+    parser.feed(html)
+    return parser
+
+
+def _field_name(form, element_id):
+    try:
+        return form.elements[element_id].get("name", element_id)
+    except KeyError:
+        raise RuntimeError(f"Element '{element_id}' not found on {BULK_DATA_URL}")
+
 
 class FFIECDownloader:
     """
-    Download Call Report data from FFIEC using Selenium
+    Download Call Report data from FFIEC with plain HTTP requests
     """
-    
+
     def __init__(self):
         self.data_dir = DATA_DIR
-        
+
+    def _zip_path(self, report_date):
+        return self.data_dir / ZIP_NAME.format(report_date=report_date.replace("/", ""))
+
+    def _fresh_zip(self, report_date):
+        """
+        Return the zip already on disk for report_date if it is recent and
+        readable, else None
+        """
+        path = self._zip_path(report_date)
+        if not path.exists():
+            return None
+        if time.time() - path.stat().st_mtime >= MAX_ZIP_AGE_SECONDS:
+            return None
+        if not zipfile.is_zipfile(path):
+            return None
+        return path
+
     def download_call_report(self, report_date: str = '03/31/2022'):
         """
         Download Call Report data from FFIEC
-        
+
         Parameters:
         -----------
         report_date : str
             Quarter end date in MM/DD/YYYY format (e.g., "12/31/2024")
         """
-        # Set Chrome download preferences
-        chrome_options = webdriver.ChromeOptions()
-        prefs = {
-            "download.default_directory": str(self.data_dir),
-            "download.prompt_for_download": False,
-            "download.directory_upgrade": True,
-            "safebrowsing.enabled": True
-        }
-        chrome_options.add_experimental_option("prefs", prefs)
-        
-        # Initialize browser
-        driver = webdriver.Chrome(options=chrome_options)
-        
+        cached = self._fresh_zip(report_date) if report_date else None
+        if cached is not None:
+            print(f"Using existing download {cached}")
+            return
+
+        session = _SESSION
+        r = None
+
         try:
             print("Opening FFIEC page...")
-            driver.get("https://cdr.ffiec.gov/public/PWS/DownloadBulkData.aspx")
-            
-            # Wait for page to load
-            wait = WebDriverWait(driver, 10)
-            
-            # Step 1: Select "Call Reports -- Single Period" from Available Products dropdown
+            r = session.get(BULK_DATA_URL, timeout=60)
+            r.raise_for_status()
+            form = _parse_form(r.text)
+            products_field = _field_name(form, PRODUCTS_ID)
+
+            # Step 1: Select "Call Reports -- Single Period"; the page posts back
+            # to fill in the reporting periods for that product
             print("Selecting Call Reports -- Single Period...")
-            products_dropdown = wait.until(
-                EC.presence_of_element_located((By.ID, "ListBox1"))
+            r = session.post(
+                BULK_DATA_URL,
+                data={
+                    **form.hidden,
+                    "__EVENTTARGET": products_field,
+                    "__EVENTARGUMENT": "",
+                    products_field: PRODUCT,
+                },
+                timeout=60,
             )
-            select_products = Select(products_dropdown)
-            select_products.select_by_value("ReportingSeriesSinglePeriod")
-            time.sleep(2)  # Wait for page to update
-            
+            r.raise_for_status()
+            form = _parse_form(r.text)
+
             # Step 2: Select the reporting period date
             print(f"Selecting reporting period: {report_date}...")
-            date_dropdown = wait.until(
-                EC.presence_of_element_located((By.ID, "DatesDropDownList"))
-            )
-            select_date = Select(date_dropdown)
-            
-            # Print all available dates for debugging
-            available_dates = [option.text for option in select_date.options]
+            available_dates = [text for _, text in form.date_options]
             print(f"Available dates: {available_dates}")
-            
+            if not form.date_options:
+                raise RuntimeError("No reporting periods found on the FFIEC page.")
+
             # Check if requested date exists
-            if report_date in available_dates:
-                select_date.select_by_visible_text(report_date)
+            date_values = {text: value for value, text in form.date_options}
+            if report_date in date_values:
+                date_value = date_values[report_date]
                 print(f"Selected: {report_date}")
             else:
                 print(f"Date {report_date} not available!")
                 print(f"  Using most recent date: {available_dates[0]}")
-                select_date.select_by_index(0)  # Select first (most recent)
-            
-            time.sleep(1)
-            
-            # Step 3: Ensure "Tab Delimited" is selected
-            print("Ensuring Tab Delimited format is selected...")
-            tab_delimited_radio = driver.find_element(By.ID, "TSVRadioButton")
-            if not tab_delimited_radio.is_selected():
-                tab_delimited_radio.click()
-            time.sleep(1)
-            
-            # Step 4: Click the download button
-            print("Clicking download button...")
-            download_button = driver.find_element(By.ID, "Download_0")
-            download_button.click()
-            
-            # Wait for download to complete
+                date_value, report_date = form.date_options[0]  # Most recent
+
+            # Step 3: Tab Delimited format and the download button
+            tsv_radio = form.elements.get(TSV_ID, {})
+            download_button = form.elements.get(DOWNLOAD_ID, {})
+            data = {
+                **form.hidden,
+                products_field: PRODUCT,
+                _field_name(form, DATES_ID): date_value,
+                tsv_radio.get("name", TSV_ID): tsv_radio.get("value", "on"),
+            }
+            button_name = download_button.get("name", DOWNLOAD_ID)
+            if download_button.get("type", "").lower() == "image":
+                data[f"{button_name}.x"] = "1"
+                data[f"{button_name}.y"] = "1"
+            else:
+                data[button_name] = download_button.get("value", "Download")
+
+            # Step 4: Post the download and stream the zip to disk
             print("Downloading... (this may take a few minutes)")
-            time.sleep(15)  # Adjust based on file size and internet speed
-            
-            print(f"Download complete! Check {self.data_dir} for the file.")
-            
+            r = session.post(BULK_DATA_URL, data=data, timeout=600, stream=True)
+            r.raise_for_status()
+
+            disposition = r.headers.get("Content-Disposition", "")
+            if "attachment" not in disposition.lower():
+                raise RuntimeError(
+                    f"Expected a zip attachment, got Content-Type "
+                    f"{r.headers.get('Content-Type')!r}"
+                )
+            match = re.search(r'filename="?([^";]+)"?', disposition)
+            # The name comes from the server; keep only its last component
+            filename = Path(match.group(1).strip()).name if match else ""
+            if not filename:
+                filename = self._zip_path(report_date).name
+
+            # Stream into a .part file and move it into place only once it is a
+            # complete zip, so a dropped connection never leaves a truncated zip
+            # at the path doit treats as this task's target
+            out_path = self.data_dir / filename
+            part_path = out_path.with_suffix(".part")
+            self.data_dir.mkdir(parents=True, exist_ok=True)
+            try:
+                with open(part_path, "wb") as f:
+                    for chunk in r.iter_content(chunk_size=1 << 20):
+                        f.write(chunk)
+                if not zipfile.is_zipfile(part_path):
+                    raise RuntimeError(f"Downloaded file is not a valid zip: {part_path}")
+                os.replace(part_path, out_path)
+            finally:
+                part_path.unlink(missing_ok=True)
+
+            print(f"Download complete! Saved {out_path}")
+
         except Exception as e:
             print(f"Error: {e}")
-            # Take screenshot for debugging
-            driver.save_screenshot(str(self.data_dir / "error_screenshot.png"))
-            print(f"Error screenshot saved to {self.data_dir / 'error_screenshot.png'}")
-            
-        finally:
-            driver.quit()
+            # Save the last page for debugging
+            disposition = r.headers.get("Content-Disposition", "") if r is not None else ""
+            if r is not None and "attachment" not in disposition.lower():
+                self.data_dir.mkdir(parents=True, exist_ok=True)
+                error_page = self.data_dir / "error_page.html"
+                error_page.write_bytes(r.content)
+                print(f"Error page saved to {error_page}")
+            # Fail the doit task instead of letting it record a missing target
+            raise
 
 
 if __name__ == "__main__":
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from pathlib import Path
 import pandas as pd
+import pyarrow as pa
 
+from parquet_io import write_parquet
 from settings import config
 
 DATA_DIR = Path(config("DATA_DIR"))
@@ -17,20 +19,22 @@ GSIB_REPORTING_BANK_IDS = [
 ]
 
 
+# Built once at import: the list is fixed, so every call just converts this
+# table. int64 ids and an int8 flag also keep gsib_list.parquet small.
+_GSIB_IDS = list(dict.fromkeys(GSIB_REPORTING_BANK_IDS))
+_GSIB_TABLE = pa.table(
+    {
+        "rssd_id_call": pa.array(_GSIB_IDS, type=pa.int64()),
+        "is_gsib": pa.array([1] * len(_GSIB_IDS), type=pa.int8()),
+    }
+)
+
+
 def pull_gsib_list() -> pd.DataFrame:
     """
     Return GSIB reporting-bank RSSD IDs as a DataFrame.
     """
-    df = pd.DataFrame({"rssd_id_call": GSIB_REPORTING_BANK_IDS})
-
-    # Ensure numeric and remove duplicates
-    df["rssd_id_call"] = pd.to_numeric(df["rssd_id_call"], errors="coerce")
-    df = df.dropna().drop_duplicates()
-
-    df["rssd_id_call"] = df["rssd_id_call"].astype(int)
-    df["is_gsib"] = 1
-
-    return df
+    return _GSIB_TABLE.to_pandas()
 
 
 def save_gsib_list(df: pd.DataFrame, filename: str = "gsib_list.parquet") -> None:
@@ -40,7 +44,7 @@ def save_gsib_list(df: pd.DataFrame, filename: str = "gsib_list.parquet") -> Non
     DATA_DIR.mkdir(parents=True, exist_ok=True)
 
     outpath = DATA_DIR / filename
-    df.to_parquet(outpath, index=False)
+    write_parquet(df, outpath)
 
     print(f"Wrote {outpath} | rows={len(df):,} cols={df.shape[1]}")
 
@@ -6,6 +6,7 @@ from typing import Dict
 import pandas as pd
 import yfinance as yf
 
+from parquet_io import write_parquet
 from settings import config
 
 DATA_DIR = Path(config("DATA_DIR"))
@@ -21,41 +22,17 @@ TICKERS: Dict[str, str] = {
 def _get_price_series(px: pd.DataFrame, ticker: str) -> pd.Series:
     """
     Extract adjusted close if available, otherwise close.
-    Handles both single-index and multi-index yfinance outputs.
+    Expects single-level field columns (see pull_etf_prices).
     """
     if px is None or px.empty:
         raise ValueError(f"No price data returned for {ticker}.")
 
-    if isinstance(px.columns, pd.MultiIndex):
-        for field in ("Adj Close", "Close"):
-            if (field, ticker) in px.columns:
-                s = px[(field, ticker)]
-                s.name = ticker
-                return s
-
-        for field in ("Adj Close", "Close"):
-            if field in px.columns.get_level_values(0):
-                sub = px[field]
-                if isinstance(sub, pd.DataFrame):
-                    s = sub.iloc[:, 0]
-                else:
-                    s = sub
-                s.name = ticker
-                return s
-
+    field = "Adj Close" if "Adj Close" in px.columns else "Close"
+    if field not in px.columns:
         raise KeyError(
-            f"No Adj Close/Close found for {ticker}. Columns: {list(px.columns)}"
+            f"No Adj Close/Close found for {ticker}. Columns: {px.columns.tolist()}"
         )
-
-    for field in ("Adj Close", "Close"):
-        if field in px.columns:
-            s = px[field].copy()
-            s.name = ticker
-            return s
-
-    raise KeyError(
-        f"No Adj Close/Close found for {ticker}. Columns: {px.columns.tolist()}"
-    )
+    return px[field].rename(ticker)
 
 
 def pull_etf_prices(
@@ -73,16 +50,27 @@ def pull_etf_prices(
     """
     series = []
 
+    # One request for all tickers; yfinance fetches them on its own threads
+    raw = yf.download(
+        list(tickers.values()),
+        start=start,
+        end=end,
+        auto_adjust=False,
+        progress=False,
+        actions=False,
+        threads=True,
+        group_by="ticker",
+    )
+
+    # Slice each ticker out of the (ticker, field) columns here, so
+    # _get_price_series only ever sees single-level field columns
     for out_col, ticker in tickers.items():
-        px = yf.download(
-            ticker,
-            start=start,
-            end=end,
-            auto_adjust=False,
-            progress=False,
-            actions=False,
-            threads=False,
-        )
+        if isinstance(raw.columns, pd.MultiIndex):
+            if ticker not in raw.columns.get_level_values(0):
+                raise ValueError(f"No price data returned for {ticker}.")
+            px = raw[ticker].dropna(how="all")
+        else:
+            px = raw
 
         s = _get_price_series(px, ticker).rename(out_col)
         s.index = pd.to_datetime(s.index, errors="coerce")
@@ -113,7 +101,7 @@ def pull_etf_prices(
 def save_mbs_etfs(df: pd.DataFrame, filename: str = "mbs_etfs.parquet") -> None:
     DATA_DIR.mkdir(parents=True, exist_ok=True)
     outpath = DATA_DIR / filename
-    df.to_parquet(outpath, index=False)
+    write_parquet(df, outpath)
 
     print(f"Wrote {outpath} | rows={len(df):,} cols={df.shape[1]}")
     if not df.empty:
@@ -1,17 +1,29 @@
 from __future__ import annotations
 
-from io import StringIO
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
-import requests
 
+# bottleneck's push is a tight C forward fill over a 2-D float array; _ffill
+# falls back to pandas where it is not installed
+try:
+    import bottleneck as bn
+except ImportError:
+    bn = None
+
+from fred_csv import FRED_RETRY, fred_csv_url, read_fred_csv
+from http_cache import conditional_get, make_session
+from parquet_io import write_parquet
 from settings import config
 
 DATA_DIR = Path(config("DATA_DIR"))
 START_DATE = config("START_DATE")
 END_DATE = config("END_DATE")
+# fred.csv is only a convenience copy of fred.parquet; opt in with EMIT_CSV=1
+EMIT_CSV = str(config("EMIT_CSV", default="0")).lower() in {"1", "true", "yes"}
 
 series_to_pull = {
     ## Macro
@@ -46,6 +58,10 @@ series_descriptions["Gen_IORB"] = "Interest on Reserves"
 series_descriptions["ONRRP_CTPY_LIMIT"] = "Counter-party Limit at Fed ON/RRP Facility"
 series_descriptions["ONRP_AGG_LIMIT"] = "Aggregate Limit at Fed Standing Repo Facility"
 
+# One keep-alive connection pool for all series, sized for the thread pool
+MAX_WORKERS = 16
+_SESSION = make_session(pool_size=MAX_WORKERS, retry=FRED_RETRY)
+
 manual_ONRRP_cntypty_limits = {  # in $ Billions
     "2013-Sep-22": 0,
     "2013-Sep-23": 1,
@@ -58,43 +74,42 @@ manual_ONRRP_cntypty_limits = {  # in $ Billions
 }
 
 
+@lru_cache(maxsize=None)
 def _fred_series_csv(series_id: str) -> pd.Series:
     """
     Pull a single FRED series via the public CSV endpoint (no API key).
     Works with either DATE or observation_date as the date column.
     Returns a Series indexed by date with name = series_id.
-    """
-    url = f"https://fred.stlouisfed.org/graph/fredgraph.csv?id={series_id}"
-    r = requests.get(url, timeout=60)
-    r.raise_for_status()
-
-    text = r.text.strip()
-    if text.lower().startswith("<!doctype html") or "<html" in text[:200].lower():
-        raise RuntimeError(f"FRED returned HTML instead of CSV for {series_id}. URL={url}")
 
-    df = pd.read_csv(StringIO(text))
+    Memoized per process, so repeated pull_fred calls (tests, notebooks) skip
+    the download and parse. The cached Series is shared: copy before mutating,
+    and call _fred_series_csv.cache_clear() to force a fresh pull.
+    """
+    content = conditional_get(
+        fred_csv_url(series_id), key=f"fred_{series_id}", session=_SESSION
+    )
+    return read_fred_csv(content, series_id)
 
-    # Date column can be DATE or observation_date depending on endpoint
-    date_col = None
-    for cand in ("DATE", "observation_date", "date", "Date"):
-        if cand in df.columns:
-            date_col = cand
-            break
-    if date_col is None:
-        raise RuntimeError(
-            f"Could not find date column for {series_id}. Columns={df.columns.tolist()[:10]}. "
-            f"First lines:\n" + "\n".join(text.splitlines()[:5])
-        )
 
-    # Value column is usually series_id
-    value_col = series_id if series_id in df.columns else df.columns[-1]
+def _step_series(levels: dict, index: pd.DatetimeIndex) -> pd.Series:
+    """
+    Expand {date: value} change points into a step series on index, holding
+    each value until the next change point. A change point that falls on a
+    date missing from index (e.g. a weekend) takes effect on the next date.
+    """
+    steps = pd.Series(levels)
+    steps.index = pd.to_datetime(steps.index)
+    steps = steps.sort_index().astype(float)
+    return steps.reindex(index.union(steps.index)).ffill().reindex(index)
 
-    df[date_col] = pd.to_datetime(df[date_col], errors="coerce")
-    s = pd.to_numeric(df[value_col], errors="coerce")
-    s.index = df[date_col]
-    s.name = series_id
-    return s
 
+def _ffill(frame: pd.DataFrame) -> pd.DataFrame:
+    """Forward fill float columns, with bottleneck.push when it is installed."""
+    if bn is None:
+        return frame.ffill()
+    # One push over the whole 2-D block instead of a pandas pass per column
+    filled = bn.push(frame.to_numpy(dtype="float64"), axis=0)
+    return pd.DataFrame(filled, index=frame.index, columns=frame.columns)
 
 
 def pull_fred(start_date=START_DATE, end_date=END_DATE, ffill=True):
@@ -104,21 +119,22 @@ def pull_fred(start_date=START_DATE, end_date=END_DATE, ffill=True):
 
     This version does NOT use pandas_datareader (works with pandas 3.0+).
     """
-    # Pull all series and join into one DataFrame
-    series_list = []
-    for code in series_to_pull.keys():
-        series_list.append(_fred_series_csv(code))
+    # Pull all series concurrently (network-bound) and join into one DataFrame;
+    # ex.map keeps the order of series_to_pull
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as ex:
+        series_list = list(ex.map(_fred_series_csv, series_to_pull.keys()))
 
-    df = pd.concat(series_list, axis=1).sort_index()
+    # Restrict each series to the requested window before aligning, so the
+    # index union and sort only cover in-window observations
+    start, end = pd.to_datetime(start_date), pd.to_datetime(end_date)
+    series_list = [s[s.index.notna()].sort_index().loc[start:end] for s in series_list]
 
-    # Restrict to requested date window
-    df = df.loc[pd.to_datetime(start_date) : pd.to_datetime(end_date)]
+    df = pd.concat(series_list, axis=1, sort=True)
 
     # Convert millions to billions
     millions_to_billions = ["TREAST", "GFDEBTN", "WALCL", "WSDONTL"]
-    for s in millions_to_billions:
-        if s in df.columns:
-            df[s] = df[s] / 1_000
+    cols = df.columns.intersection(millions_to_billions)
+    df[cols] = df[cols] / 1_000
 
     # Forward fill selected series
     if ffill:
@@ -133,9 +149,8 @@ def pull_fred(start_date=START_DATE, end_date=END_DATE, ffill=True):
             "RRPONTSYAWARD",
             "WSDONTL",
         ]
-        for s in forward_fill:
-            if s in df.columns:
-                df[s] = df[s].ffill()
+        cols = df.columns.intersection(forward_fill)
+        df[cols] = _ffill(df[cols])
 
     # When IORB is missing, use IOER (interest on excess reserves)
     if "IORB" in df.columns and "IOER" in df.columns:
@@ -144,16 +159,10 @@ def pull_fred(start_date=START_DATE, end_date=END_DATE, ffill=True):
         df["Gen_IORB"] = np.nan
 
     # Manual ONRRP counterparty limits
-    df["ONRRP_CTPY_LIMIT"] = np.nan
-    for key, val in manual_ONRRP_cntypty_limits.items():
-        date = pd.to_datetime(key)
-        df.loc[date, "ONRRP_CTPY_LIMIT"] = val
-    df["ONRRP_CTPY_LIMIT"] = df["ONRRP_CTPY_LIMIT"].ffill()
+    df["ONRRP_CTPY_LIMIT"] = _step_series(manual_ONRRP_cntypty_limits, df.index)
 
     # Standing repo facility aggregate limit
-    df["ONRP_AGG_LIMIT"] = np.nan
-    df.loc[pd.to_datetime("2021-07-28"), "ONRP_AGG_LIMIT"] = 500
-    df["ONRP_AGG_LIMIT"] = df["ONRP_AGG_LIMIT"].ffill()
+    df["ONRP_AGG_LIMIT"] = _step_series({"2021-07-28": 500}, df.index)
 
     # Drop original reserve rate columns like before
     df_focused = df.drop(columns=["IORR", "IOER", "IORB"], errors="ignore")
@@ -182,6 +191,12 @@ if __name__ == "__main__":
     filedir = Path(DATA_DIR)
     filedir.mkdir(parents=True, exist_ok=True)
 
-    df.to_parquet(filedir / "fred.parquet")
-    df.to_csv(filedir / "fred.csv")
-    print(f"Wrote {filedir / 'fred.parquet'} and {filedir / 'fred.csv'} | rows={len(df):,} cols={df.shape[1]}")
+    # float32 keeps ~7 significant digits, plenty for rates and $ billions
+    num_cols = df.select_dtypes("float64").columns
+    df[num_cols] = df[num_cols].astype("float32")
+
+    write_parquet(df, filedir / "fred.parquet", index=None)
+    print(f"Wrote {filedir / 'fred.parquet'} | rows={len(df):,} cols={df.shape[1]}")
+    if EMIT_CSV:
+        df.to_csv(filedir / "fred.csv")
+        print(f"Wrote {filedir / 'fred.csv'}")
@@ -1,21 +1,15 @@
 from __future__ import annotations
 
-from io import StringIO
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from io import BytesIO
 from pathlib import Path
 import time
 
 import pandas as pd
-import requests
-
-# Optional settings.config; if unavailable, uses a simple fallback
-try:
-    from settings import config
-except Exception:
-    def config(key: str) -> str:
-        if key == "DATA_DIR":
-            return "./_data"
-        raise KeyError(key)
 
+from http_cache import make_session
+from parquet_io import write_parquet
+from settings import config
 
 DATA_DIR = Path(config("DATA_DIR"))
 DATA_DIR.mkdir(parents=True, exist_ok=True)
@@ -65,7 +59,9 @@ def _normalize_dataframe(df: pd.DataFrame, series_code: str) -> pd.DataFrame:
             raise ValueError(f"Could not locate a value column for {series_code}")
         value_col = candidate_cols[-1]
 
-    df["date"] = pd.to_datetime(df["date"], errors="coerce")
+    # FRED CSV dates are always YYYY-MM-DD; an explicit format keeps pandas on
+    # its fast C parser instead of guessing the format per element
+    df["date"] = pd.to_datetime(df["date"], format="%Y-%m-%d", errors="coerce", cache=True)
     df[value_col] = pd.to_numeric(df[value_col], errors="coerce")
 
     df = df.dropna(subset=["date", value_col])
@@ -75,16 +71,18 @@ def _normalize_dataframe(df: pd.DataFrame, series_code: str) -> pd.DataFrame:
     return df
 
 
+# One keep-alive pool for the process, sized for main()'s thread pool, so the
+# TCP/TLS connection to FRED is reused across series and pull()'s retries
+_SESSION = make_session(
+    pool_size=len(SERIES),
+    headers={"User-Agent": "Mozilla/5.0", "Accept": "text/csv,*/*"},
+)
+
+
 def pull(series_code: str, max_retries: int = 3, timeout: int = 20) -> pd.DataFrame:
     url = BASE_URL.format(series=series_code)
 
-    session = requests.Session()
-    session.headers.update(
-        {
-            "User-Agent": "Mozilla/5.0",
-            "Accept": "text/csv,*/*",
-        }
-    )
+    session = _SESSION
 
     last_err = None
 
@@ -93,16 +91,18 @@ def pull(series_code: str, max_retries: int = 3, timeout: int = 20) -> pd.DataFr
             resp = session.get(url, timeout=timeout)
             resp.raise_for_status()
 
-            text = resp.text.strip()
+            content = resp.content
 
-            # Catch HTML/error pages from FRED
-            if text.lower().startswith("<!doctype html") or "<html" in text[:200].lower():
+            # Catch HTML/error pages from FRED; only the first bytes are needed
+            head = content[:256].lstrip().lower()
+            if head.startswith(b"<!doctype html") or b"<html" in head:
                 raise RuntimeError(
                     f"FRED returned HTML instead of CSV for {series_code}. "
-                    f"First 200 chars: {text[:200]}"
+                    f"First 200 chars: {content[:200].decode('utf-8', 'replace')}"
                 )
 
-            df = pd.read_csv(StringIO(text))
+            # The C parser reads the raw bytes; no decoded copy of the body
+            df = pd.read_csv(BytesIO(content))
             df = _normalize_dataframe(df, series_code)
             return df
 
@@ -127,27 +127,37 @@ def write_placeholder() -> None:
             "dgs30": pd.Series(dtype="float64"),
         }
     )
-    placeholder.to_parquet(OUTPUT_PATH, index=False)
+    write_parquet(placeholder, OUTPUT_PATH)
     print(f"Wrote placeholder file to {OUTPUT_PATH}")
 
 
 def main() -> None:
-    pulled = []
+    pulled = {}
 
-    for out_name, fred_code in SERIES.items():
-        try:
-            df = pull(fred_code)
+    # Each pull is an independent, network-bound request, so run them concurrently
+    with ThreadPoolExecutor(max_workers=len(SERIES)) as ex:
+        futures = {
+            ex.submit(pull, fred_code): (out_name, fred_code)
+            for out_name, fred_code in SERIES.items()
+        }
+        for future in as_completed(futures):
+            out_name, fred_code = futures[future]
+            try:
+                df = future.result()
 
-            # Make sure the final column name matches the desired output name
-            expected_col = fred_code.lower()
-            if expected_col != out_name and expected_col in df.columns:
-                df = df.rename(columns={expected_col: out_name})
+                # Make sure the final column name matches the desired output name
+                expected_col = fred_code.lower()
+                if expected_col != out_name and expected_col in df.columns:
+                    df = df.rename(columns={expected_col: out_name})
 
-            pulled.append(df)
-            print(f"Pulled {fred_code} -> shape {df.shape}")
+                pulled[out_name] = df
+                print(f"Pulled {fred_code} -> shape {df.shape}")
 
-        except Exception as e:
-            print(f"Skipping {fred_code}: {e}")
+            except Exception as e:
+                print(f"Skipping {fred_code}: {e}")
+
+    # Keep the column order of SERIES regardless of completion order
+    pulled = [pulled[name] for name in SERIES if name in pulled]
 
     if not pulled:
         write_placeholder()
@@ -162,7 +172,7 @@ def main() -> None:
     value_cols = [c for c in out.columns if c != "date"]
     out = out.dropna(subset=value_cols, how="all")
 
-    out.to_parquet(OUTPUT_PATH, index=False)
+    write_parquet(out, OUTPUT_PATH)
 
     print(f"Wrote {OUTPUT_PATH} | rows={len(out)} cols={out.shape[1]}")
     if not out.empty:
@@ -1,6 +1,11 @@
 import pandas as pd
 from pathlib import Path
 
+from parquet_io import write_parquet
+from settings import config
+
+DATA_DIR = Path(config("DATA_DIR"))
+
 data = {
     "d_tsy_lt1y": [0.02],
     "d_tsy_1_3y": [0.025],
@@ -13,8 +18,8 @@ data = {
 
 df = pd.DataFrame(data)
 
-Path("_data").mkdir(exist_ok=True)
-df.to_parquet("_data/market_shocks.parquet", index=False)
+DATA_DIR.mkdir(parents=True, exist_ok=True)
+write_parquet(df, DATA_DIR / "market_shocks.parquet")
 
 print(df)
 print("market_shocks.parquet created.")
\ No newline at end of file
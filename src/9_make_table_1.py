@@ -1,6 +1,7 @@
 from pathlib import Path
 import numpy as np
 import pandas as pd
+import pyarrow.parquet as pq
 
 import importlib.util
 spec = importlib.util.spec_from_file_location(
@@ -97,7 +98,6 @@ def main() -> None:
     if not shocks_path.exists():
         raise FileNotFoundError(f"Missing market shocks: {shocks_path}")
 
-    banks = pd.read_parquet(bank_panel_path)
     shocks = pd.read_parquet(shocks_path).iloc[0]
 
     required_base_cols = [
@@ -119,13 +119,18 @@ def main() -> None:
         )
 
     required_cols = required_base_cols + required_bucket_cols
-    missing = [c for c in required_cols if c not in banks.columns]
+
+    # Check against the parquet footer, then read only the columns Table 1 uses
+    available_cols = set(pq.read_schema(bank_panel_path).names)
+    missing = [c for c in required_cols if c not in available_cols]
     if missing:
         raise ValueError(
             "Missing required columns for bucket-based Table 1:\n"
             + ", ".join(missing)
         )
 
+    banks = pd.read_parquet(bank_panel_path, columns=required_cols)
+
     banks["rssd_id_call"] = pd.to_numeric(
         banks["rssd_id_call"], errors="coerce"
     ).astype("Int64")
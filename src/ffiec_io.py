@@ -0,0 +1,84 @@
+"""
+Read FFIEC Call Report schedules out of the bulk-download zip.
+
+read_ffiec parses one tab-delimited schedule; read_ffiec_cached keeps a
+parquet copy of each parsed schedule keyed on the zip member's size and CRC.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+import pandas as pd
+
+from parquet_io import write_parquet
+
+# Bump when read_ffiec changes so previously cached schedules are not reused
+READ_FFIEC_CACHE_VERSION = "2"
+
+# Only the bank id and these item prefixes are used downstream
+FFIEC_ITEM_PREFIXES = ("rcfd", "rcon", "rcfn")
+
+
+def _keep_ffiec_col(name):
+    name = name.strip().replace('"', "").lower()
+    return name == "idrssd" or name.startswith(FFIEC_ITEM_PREFIXES)
+
+
+def read_ffiec(zf, filename):
+    # Let the C parser build numeric columns directly instead of reading every
+    # cell as a Python str and converting afterwards
+    with zf.open(filename) as f:
+        df = pd.read_csv(
+            f,
+            sep="\t",
+            header=0,
+            skiprows=[1],
+            usecols=_keep_ffiec_col,
+            low_memory=False,
+        )
+    df.columns = df.columns.str.strip().str.replace('"', "").str.lower()
+    df = df.rename(columns={"idrssd": "rssd9001"})
+    df["rssd9001"] = pd.to_numeric(df["rssd9001"], errors="coerce")
+    df = df.dropna(subset=["rssd9001"])
+    df["rssd9001"] = df["rssd9001"].astype(int)
+    df = df.set_index("rssd9001")
+
+    # Columns holding any non-numeric cell come back as strings; coerce only those
+    text_cols = df.select_dtypes(exclude="number").columns
+    if len(text_cols):
+        df[text_cols] = df[text_cols].apply(pd.to_numeric, errors="coerce")
+    return df
+
+
+def _cache_key(zf, filename):
+    """Content address for a zip member: its name, size, and CRC-32."""
+    info = zf.getinfo(filename)
+    key_inputs = {
+        "member": filename,
+        "file_size": info.file_size,
+        "crc": info.CRC,
+        "version": READ_FFIEC_CACHE_VERSION,
+    }
+    digest = hashlib.sha256(
+        "|".join(str(v) for v in key_inputs.values()).encode()
+    ).hexdigest()[:16]
+    return digest, key_inputs
+
+
+def read_ffiec_cached(zf, filename, cache_dir):
+    """
+    Same as read_ffiec, but reuses cache_dir/<key>.parquet when the zip
+    member is unchanged. A <key>.json sidecar records the key inputs.
+    """
+    cache_dir = Path(cache_dir)
+    key, key_inputs = _cache_key(zf, filename)
+    cache_path = cache_dir / f"{key}.parquet"
+    if cache_path.exists():
+        return pd.read_parquet(cache_path)
+
+    df = read_ffiec(zf, filename)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    write_parquet(df, cache_path, index=None)
+    (cache_dir / f"{key}.json").write_text(json.dumps(key_inputs, indent=2))
+    return df
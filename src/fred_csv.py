@@ -0,0 +1,71 @@
+"""
+Parse responses from FRED's public fredgraph.csv endpoint (no API key).
+
+Shared by 5_pull_fred.py and 6_pull_treasury_price_index.py, which fetch the
+bytes with http_cache.conditional_get and hand them to read_fred_csv.
+"""
+
+from __future__ import annotations
+
+from io import BytesIO
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+from urllib3.util.retry import Retry
+
+# Backoff on FRED rate limiting and transient server errors
+FRED_RETRY = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+
+# FRED's CSV endpoint uses observation_date; DATE is the older header
+FRED_DATE_COLS = ("observation_date", "DATE")
+
+# Keep FRED's date column (either header) as text in Arrow, so a malformed
+# date becomes NaT in pd.to_datetime below instead of failing the whole read
+FRED_CSV_CONVERT = pacsv.ConvertOptions(
+    column_types={col: pa.string() for col in FRED_DATE_COLS}
+)
+
+
+def fred_csv_url(series_id: str) -> str:
+    return f"https://fred.stlouisfed.org/graph/fredgraph.csv?id={series_id}"
+
+
+def read_fred_csv(content: bytes, series_id: str) -> pd.Series:
+    """
+    Parse a fredgraph.csv body into a Series indexed by date with
+    name = series_id. Raises RuntimeError if FRED sent an HTML page or the
+    CSV has no date column.
+    """
+    # Only the first bytes are needed to spot an HTML error page, so the body
+    # is not decoded on the happy path
+    head = content[:200].lstrip().lower()
+    if head.startswith(b"<!doctype html") or b"<html" in head:
+        raise RuntimeError(
+            f"FRED returned HTML instead of CSV for {series_id}. "
+            f"URL={fred_csv_url(series_id)}\n"
+            f"First 200 chars:\n{content[:200].decode('utf-8', 'replace')}"
+        )
+
+    # Arrow's multithreaded C++ reader parses the raw bytes
+    df = pacsv.read_csv(BytesIO(content), convert_options=FRED_CSV_CONVERT).to_pandas()
+
+    date_col = next((col for col in FRED_DATE_COLS if col in df.columns), None)
+    if date_col is None:
+        raise RuntimeError(
+            f"Could not find date column for {series_id}. Columns={df.columns.tolist()[:10]}. "
+            f"First lines:\n" + "\n".join(content.decode("utf-8", "replace").splitlines()[:5])
+        )
+
+    # Value column is usually series_id
+    value_col = series_id if series_id in df.columns else df.columns[-1]
+
+    # FRED dates are always YYYY-MM-DD; the explicit format skips per-element
+    # inference and cache=True parses each distinct date once
+    df[date_col] = pd.to_datetime(
+        df[date_col], format="%Y-%m-%d", errors="coerce", cache=True
+    )
+    s = pd.to_numeric(df[value_col], errors="coerce")
+    s.index = df[date_col]
+    s.name = series_id
+    return s
@@ -0,0 +1,102 @@
+"""
+Shared HTTP helpers for the pull scripts: make_session builds their
+keep-alive sessions, and conditional_get is a small on-disk cache for
+repeated downloads (e.g. FRED CSVs).
+
+A response body is stored as DATA_DIR/cache/http/<key>.body, with its ETag /
+Last-Modified headers in <key>.json. The next request for the same key sends
+If-None-Match / If-Modified-Since and reuses the stored body on a 304.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from settings import config
+
+DATA_DIR = Path(config("DATA_DIR"))
+HTTP_CACHE_DIR = DATA_DIR / "cache" / "http"
+
+
+def make_session(
+    pool_size: int = 10,
+    retry: Retry | None = None,
+    headers: dict | None = None,
+) -> requests.Session:
+    """
+    Keep-alive Session with up to pool_size HTTPS connections to a host (size
+    it for the caller's thread pool). retry becomes the adapter's
+    max_retries; None keeps requests' default of no retries.
+    """
+    session = requests.Session()
+    if headers:
+        session.headers.update(headers)
+    session.mount(
+        "https://",
+        HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=pool_size,
+            max_retries=retry if retry is not None else 0,
+        ),
+    )
+    return session
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write data to a temp file next to path, then rename it over path."""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+def conditional_get(
+    url: str,
+    key: str,
+    session: requests.Session | None = None,
+    timeout: int = 60,
+) -> bytes:
+    """
+    GET url and return the response body, revalidating a cached copy stored
+    under key instead of downloading it again when the server says 304.
+    """
+    body_path = HTTP_CACHE_DIR / f"{key}.body"
+    meta_path = HTTP_CACHE_DIR / f"{key}.json"
+
+    headers = {}
+    if body_path.exists() and meta_path.exists():
+        meta = json.loads(meta_path.read_text())
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    r = (session or requests).get(url, headers=headers, timeout=timeout)
+    if r.status_code == 304:
+        return body_path.read_bytes()
+    r.raise_for_status()
+
+    etag = r.headers.get("ETag")
+    last_modified = r.headers.get("Last-Modified")
+    if etag or last_modified:
+        HTTP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Drop the old validators first and write the new ones last, so an
+        # interrupted write can never pair a partial body with a valid ETag
+        meta_path.unlink(missing_ok=True)
+        _atomic_write(body_path, r.content)
+        _atomic_write(
+            meta_path,
+            json.dumps({"url": url, "etag": etag, "last_modified": last_modified}).encode(),
+        )
+    return r.content
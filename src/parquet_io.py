@@ -0,0 +1,43 @@
+"""
+Shared parquet writer for the pipeline outputs.
+
+Every frame is written through pyarrow directly with zstd (level 3) and
+dictionary encoding, so compression is tuned in one place instead of in each
+script's to_parquet call.
+"""
+
+from __future__ import annotations
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+PARQUET_OPTIONS = {
+    "compression": "zstd",
+    "compression_level": 3,
+    "use_dictionary": True,
+}
+
+
+def write_parquet(df: pd.DataFrame, path, index: bool | None = False, **writer_kwargs) -> None:
+    """
+    Write df to path. index follows DataFrame.to_parquet; writer_kwargs
+    override PARQUET_OPTIONS.
+    """
+    table = pa.Table.from_pandas(df, preserve_index=index)
+    pq.write_table(table, path, **{**PARQUET_OPTIONS, **writer_kwargs})
+
+
+def write_parquet_chunked(df: pd.DataFrame, path, chunk_rows: int = 50_000, **writer_kwargs) -> None:
+    """
+    Write df to parquet one row group at a time, so only a chunk_rows slice is
+    converted to Arrow at once rather than a full copy of the frame. Each
+    slice becomes its own row group, which lets filtered reads skip groups.
+    """
+    schema = pa.Schema.from_pandas(df, preserve_index=False)
+    with pq.ParquetWriter(path, schema, **{**PARQUET_OPTIONS, **writer_kwargs}) as writer:
+        for start in range(0, len(df), chunk_rows):
+            chunk = df.iloc[start : start + chunk_rows]
+            writer.write_table(
+                pa.Table.from_pandas(chunk, schema=schema, preserve_index=False)
+            )
@@ -105,13 +105,31 @@ print(f"Large non-GSIB:   {large_non_gsib}")
 
 # %%
 import numpy as np
-
-fig = px.histogram(
-    bank_panel,
-    x=np.log10(bank_panel["Total Asset"].replace(0, np.nan)),
+import plotly.graph_objects as go
+
+
+def binned_histogram(values, nbins, title, xaxis_title):
+    """
+    Bin with np.histogram and send only the bar heights to plotly, so the
+    figure carries nbins bars rather than one value per bank. Non-finite
+    values (e.g. log10 of a zero balance) are dropped, as px.histogram does.
+    """
+    values = np.asarray(values, dtype=float)
+    counts, edges = np.histogram(values[np.isfinite(values)], bins=nbins)
+    fig = go.Figure(
+        go.Bar(x=(edges[:-1] + edges[1:]) / 2, y=counts, width=np.diff(edges))
+    )
+    fig.update_layout(
+        title=title, xaxis_title=xaxis_title, yaxis_title="count", bargap=0
+    )
+    return fig
+
+
+fig = binned_histogram(
+    np.log10(bank_panel["Total Asset"].replace(0, np.nan)),
     nbins=100,
     title="Distribution of Bank Assets (Log Scale)",
-    labels={"x": "Total Assets"},
+    xaxis_title="Total Assets",
 )
 
 fig.update_xaxes(
@@ -138,12 +156,11 @@ fig
 # withdraw since their funds are not protected.
 
 # %%
-fig = px.histogram(
-    bank_panel,
-    x=np.log10(bank_panel["Uninsured Deposit"].replace(0, np.nan)),
+fig = binned_histogram(
+    np.log10(bank_panel["Uninsured Deposit"].replace(0, np.nan)),
     nbins=100,
     title="Distribution of Uninsured Deposits (Log Scale)",
-    labels={"x": "Log10(Uninsured Deposit)"},
+    xaxis_title="Log10(Uninsured Deposit)",
 )
 
 fig.update_xaxes(
@@ -158,12 +175,11 @@ bank_panel["uninsured_ratio"] = (
     bank_panel["Uninsured Deposit"] / bank_panel["Total Asset"] * 100
 )
 
-fig = px.histogram(
-    bank_panel,
-    x="uninsured_ratio",
+fig = binned_histogram(
+    bank_panel["uninsured_ratio"],
     nbins=100,
     title="Uninsured Deposits as % of Total Assets",
-    labels={"uninsured_ratio": "Uninsured Deposit / Total Asset (%)"},
+    xaxis_title="Uninsured Deposit / Total Asset (%)",
 )
 
 fig
@@ -1,7 +1,12 @@
 from pathlib import Path
 import pandas as pd
 
-DATA_DIR = Path("_data")
+from parquet_io import write_parquet
+from settings import config
+
+DATA_DIR = Path(config("DATA_DIR"))
+# The DGS*.csv downloads this backup reads are checked in under data_manual/
+MANUAL_DATA_DIR = Path(config("MANUAL_DATA_DIR"))
 
 SERIES = {
     "DGS1": "dgs1",
@@ -16,7 +21,7 @@ dfs = []
 
 for fred_name, col_name in SERIES.items():
 
-    path = DATA_DIR / f"{fred_name}.csv"
+    path = MANUAL_DATA_DIR / f"{fred_name}.csv"
 
     print(f"Reading {path}")
 
@@ -24,7 +29,10 @@ for fred_name, col_name in SERIES.items():
 
     df.columns = [c.lower() for c in df.columns]
 
-    df["observation_date"] = pd.to_datetime(df["observation_date"], errors="coerce")
+    # FRED CSV dates are YYYY-MM-DD
+    df["observation_date"] = pd.to_datetime(
+        df["observation_date"], format="%Y-%m-%d", errors="coerce", cache=True
+    )
 
     value_col = fred_name.lower()
 
@@ -41,11 +49,12 @@ for df in dfs[1:]:
 
 out = out.sort_values("observation_date").reset_index(drop=True)
 
+DATA_DIR.mkdir(parents=True, exist_ok=True)
 csv_out = DATA_DIR / "treasury_yields.csv"
 parquet_out = DATA_DIR / "treasury_yields.parquet"
 
 out.to_csv(csv_out, index=False)
-out.to_parquet(parquet_out, index=False)
+write_parquet(out, parquet_out)
 
 print("\nSaved:")
 print(csv_out)
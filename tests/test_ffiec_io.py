@@ -0,0 +1,45 @@
+import zipfile
+
+import pandas as pd
+import pytest
+
+import ffiec_io
+
+MEMBER = "FFIEC CDR Call Schedule RC 12312025.txt"
+SCHEDULE = (
+    '"IDRSSD"\t"RCFD2170"\t"RCON2200"\t"TEXT0001"\n'
+    '""\t"TOTAL ASSETS"\t"TOTAL DEPOSITS"\t"NOTE"\n'
+    '37\t1000\t800\tfoo\n'
+    '242\t2500\t\tbar\n'
+)
+
+
+@pytest.fixture
+def zf(tmp_path):
+    path = tmp_path / "bulk.zip"
+    with zipfile.ZipFile(path, "w") as out:
+        out.writestr(MEMBER, SCHEDULE)
+    with zipfile.ZipFile(path) as f:
+        yield f
+
+
+def test_read_ffiec_keeps_id_and_items(zf):
+    df = ffiec_io.read_ffiec(zf, MEMBER)
+
+    assert df.index.name == "rssd9001"
+    assert df.index.tolist() == [37, 242]
+    assert df.columns.tolist() == ["rcfd2170", "rcon2200"]
+
+
+def test_read_ffiec_cached_hit_returns_same_frame(zf, tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+    first = ffiec_io.read_ffiec_cached(zf, MEMBER, cache_dir)
+    assert len(list(cache_dir.glob("*.parquet"))) == 1
+
+    def fail(*args):
+        raise AssertionError("cache hit should not re-read the zip member")
+
+    monkeypatch.setattr(ffiec_io, "read_ffiec", fail)
+    second = ffiec_io.read_ffiec_cached(zf, MEMBER, cache_dir)
+
+    pd.testing.assert_frame_equal(second, first)
@@ -0,0 +1,34 @@
+import importlib.util
+from pathlib import Path
+
+TESTS = Path(__file__).resolve().parent
+SRC = TESTS.parent / "src"
+spec = importlib.util.spec_from_file_location("pull_ffiec_script", SRC / "1_pull_ffiec.py")
+mod = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(mod)
+
+PAGE = (TESTS / "fixtures" / "ffiec_bulk_download.html").read_text()
+
+
+def test_parse_form_collects_hidden_fields():
+    form = mod._parse_form(PAGE)
+
+    assert form.hidden == {
+        "__VIEWSTATE": "dDwtMTIzNDU2Nzg5Ozs+",
+        "__EVENTVALIDATION": "/wEWAgKX",
+    }
+
+
+def test_parse_form_collects_reporting_periods():
+    form = mod._parse_form(PAGE)
+
+    assert form.date_options == [("151", "12/31/2025"), ("150", "09/30/2025")]
+
+
+def test_parse_form_resolves_control_names():
+    form = mod._parse_form(PAGE)
+
+    assert mod._field_name(form, mod.PRODUCTS_ID) == "ctl00$MainContentHolder$ListBox1"
+    assert mod._field_name(form, mod.DATES_ID) == "ctl00$MainContentHolder$DatesDropDownList"
+    assert form.elements[mod.TSV_ID]["name"] == "ctl00$MainContentHolder$FormatType"
+    assert form.elements[mod.TSV_ID]["value"] == "TSVRadioButton"
@@ -0,0 +1,70 @@
+import pytest
+
+import http_cache
+
+
+class _Response:
+    def __init__(self, status_code, content=b"", headers=None):
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+class _StubSession:
+    """Returns the queued responses in order and records the request headers."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.sent_headers = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.sent_headers.append(headers)
+        return self.responses.pop(0)
+
+
+def test_conditional_get_reuses_body_on_304(tmp_path, monkeypatch):
+    monkeypatch.setattr(http_cache, "HTTP_CACHE_DIR", tmp_path)
+    session = _StubSession(
+        _Response(200, b"date,value\n2020-01-01,1\n", {"ETag": '"v1"'}),
+        _Response(304),
+    )
+
+    first = http_cache.conditional_get("https://example.test/a", "a", session=session)
+    second = http_cache.conditional_get("https://example.test/a", "a", session=session)
+
+    assert second == first == b"date,value\n2020-01-01,1\n"
+    assert session.sent_headers[0] == {}
+    assert session.sent_headers[1] == {"If-None-Match": '"v1"'}
+
+
+def test_conditional_get_does_not_cache_without_validators(tmp_path, monkeypatch):
+    monkeypatch.setattr(http_cache, "HTTP_CACHE_DIR", tmp_path)
+    session = _StubSession(_Response(200, b"x"), _Response(200, b"y"))
+
+    assert http_cache.conditional_get("https://example.test/b", "b", session=session) == b"x"
+    assert http_cache.conditional_get("https://example.test/b", "b", session=session) == b"y"
+    assert session.sent_headers == [{}, {}]
+    assert not list(tmp_path.iterdir())
+
+
+def test_conditional_get_keeps_no_validators_after_failed_write(tmp_path, monkeypatch):
+    monkeypatch.setattr(http_cache, "HTTP_CACHE_DIR", tmp_path)
+    http_cache.conditional_get(
+        "https://example.test/c", "c", session=_StubSession(_Response(200, b"old", {"ETag": '"v1"'}))
+    )
+
+    def fail(path, data):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(http_cache, "_atomic_write", fail)
+    session = _StubSession(_Response(200, b"new", {"ETag": '"v2"'}))
+    with pytest.raises(OSError):
+        http_cache.conditional_get("https://example.test/c", "c", session=session)
+
+    # Without a sidecar the next request is unconditional, never a 304
+    assert not (tmp_path / "c.json").exists()
+    assert (tmp_path / "c.body").read_bytes() == b"old"
@@ -0,0 +1,51 @@
+import importlib.util
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+spec = importlib.util.spec_from_file_location("pull_fred_script", SRC / "5_pull_fred.py")
+mod = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(mod)
+
+
+def test_step_series_weekend_change_point_applies_next_business_day():
+    index = pd.bdate_range("2021-07-15", "2021-07-27")
+    levels = {"2021-Jul-19": 1, "2021-Jul-24": 5}  # Jul 24 is a Saturday
+
+    s = mod._step_series(levels, index)
+
+    assert s.index.equals(index)
+    assert np.isnan(s["2021-07-16"])
+    assert s["2021-07-19"] == 1
+    assert s["2021-07-23"] == 1
+    assert s["2021-07-26"] == 5
+    assert s["2021-07-27"] == 5
+
+
+def _gappy_frame():
+    index = pd.bdate_range("2021-07-01", periods=6)
+    return pd.DataFrame(
+        {
+            "TREAST": [np.nan, 1.0, np.nan, np.nan, 4.0, np.nan],
+            "WALCL": [2.0, np.nan, 3.0, np.nan, np.nan, np.nan],
+        },
+        index=index,
+    )
+
+
+def test_ffill_without_bottleneck_matches_pandas(monkeypatch):
+    df = _gappy_frame()
+    monkeypatch.setattr(mod, "bn", None)
+
+    pd.testing.assert_frame_equal(mod._ffill(df), df.ffill())
+
+
+def test_ffill_with_bottleneck_matches_pandas(monkeypatch):
+    bn = pytest.importorskip("bottleneck")
+    df = _gappy_frame()
+    monkeypatch.setattr(mod, "bn", bn)
+
+    pd.testing.assert_frame_equal(mod._ffill(df), df.ffill())